@@ -2,9 +2,11 @@
 # pylint: disable=missing-module-docstring
 # pylint: disable=missing-class-docstring
 from enum import Enum
-from typing import Callable
 
-from core.machine.config import MIN_NUM, MAX_NUM, N_BITS
+from core.machine.config import (
+    MIN_NUM, MAX_NUM, N_BITS,
+    OP_ADD, OP_SUB, OP_MUL, OP_DIV, OP_MOD, OP_XOR, OP_AND, OP_OR
+)
 
 
 class Flag(Enum):
@@ -67,12 +69,20 @@ class ALU:
             flag: False
             for flag in Flag.__members__
         }
+        # the same flags packed into bits: bit <flag.value> is set
+        # if flag is set
+        self.flags_byte: int = 0
 
     def set_flag(self, flag: Flag, value: bool) -> None:
         """
         Make flag equal to value
         """
         self.flags[flag.name] = value
+        bit: int = 1 << flag.value
+        if value:
+            self.flags_byte |= bit
+        else:
+            self.flags_byte &= ~bit
 
     def get_flag(self, flag: Flag) -> bool:
         """
@@ -80,21 +90,40 @@ class ALU:
         """
         return self.flags[flag.name]
 
-    def operation(
-            self,
-            operation: Callable,
-            first: int,
-            second: int
-    ) -> int:
+    def _set_result(self, result: int) -> int:
         """
-        Perform operation with two numbers and set flags
+        Set flags by operation result and convert it to N_BITS-format
         """
-        result: int = operation(first, second)
         self.set_flag(Flag.N, _get_sign(result))
         self.set_flag(Flag.Z, _get_zero(result))
         self.set_flag(Flag.V, _get_overflow(result))
         self.set_flag(Flag.C, _get_carry(result))
         return _strip_number(result)
 
+    def operation_by_id(self, op_id: int, first: int, second: int) -> int:
+        """
+        Perform operation with given code (OP_*) and set flags
+        """
+        result: int
+        if op_id == OP_ADD:
+            result = first + second
+        elif op_id == OP_SUB:
+            result = first - second
+        elif op_id == OP_MOD:
+            result = first % second
+        elif op_id == OP_XOR:
+            result = first ^ second
+        elif op_id == OP_MUL:
+            result = first * second
+        elif op_id == OP_DIV:
+            result = first // second
+        elif op_id == OP_AND:
+            result = first & second
+        elif op_id == OP_OR:
+            result = first | second
+        else:
+            raise ValueError(f'Unknown operation code: {op_id}')
+        return self._set_result(result)
+
     def __str__(self) -> str:
         return str(self.flags)
@@ -27,8 +27,15 @@ class ClockGenerator:
     def tick(self) -> None:
         self._tick += 1
 
+    def tick_n(self, ticks: int) -> None:
+        self._tick += ticks
+
     def inst(self) -> None:
         self._inst += 1
 
+    def advance(self, ticks: int, instructions: int) -> None:
+        self._tick += ticks
+        self._inst += instructions
+
     def __str__(self) -> str:
         return f'tick: {self._tick}, inst: {self._inst}'
@@ -8,6 +8,7 @@ Computer system containing:
     - data memory controller
     - instruction controller
 """
+from collections import deque
 from typing import Iterator
 
 from core.machine.alu import ALU
@@ -19,6 +20,9 @@ from core.machine.memory_controller import MemoryController
 from core.model import Program, TextSection
 from core.machine.register_controller import RegisterController
 
+# Number of instructions executed at once without trace
+_BATCH_SIZE = 1024
+
 
 class Computer:
     """
@@ -47,7 +51,20 @@ class Computer:
         Execute given program
         """
         self.m_controller.load_data(program.data.memory)
+        # state is observed only between instructions
+        self.instruction_executor.fast = trace == Trace.NO
         code: TextSection = program.text
+        self.instruction_executor.bind_instructions(code.lines)
+
+        if trace == Trace.NO:
+            try:
+                while self.instruction_executor.run_until(
+                        code.lines, _BATCH_SIZE
+                ):
+                    pass
+            except ProgramExit:
+                pass
+            return
 
         while (
                 (pointer := self.r_controller.get_instruction_pointer())
@@ -58,11 +75,10 @@ class Computer:
                 gen: Iterator = (
                     self.instruction_executor.execute(current_instruction)
                 )
+                # run instruction till the end
+                deque(gen, maxlen=0)
                 if trace == Trace.INST:
-                    [*_] = gen
                     yield self
-                else:
-                    [*_] = gen
             except ProgramExit:
                 return
 
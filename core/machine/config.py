@@ -20,6 +20,16 @@ MEMORY_SIZE = 256
 # Null terminator (end of string)
 NULL_TERM = 0x00
 
+# ALU operation codes
+OP_ADD = 0
+OP_SUB = 1
+OP_MUL = 2
+OP_DIV = 3
+OP_MOD = 4
+OP_XOR = 5
+OP_AND = 6
+OP_OR = 7
+
 STDIN: int = 0
 STDOUT: int = 1
 STDERR: int = 2
@@ -1,33 +1,90 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
 # pylint: disable=missing-function-docstring
 # pylint: disable=missing-module-docstring
-import operator
-from types import UnionType
-from typing import Callable, Optional, Iterator, Iterable
+# pylint: disable=too-many-instance-attributes
+from collections import deque
+from functools import partial
+from types import NoneType, UnionType
+from typing import Callable, Optional, Iterator, Union, get_args, get_origin
 
-from core.machine.alu import ALU, Flag
+from core.machine.alu import ALU, Flag, _strip_number
 from core.machine.clock import ClockGenerator
 from core.exceptions import (
     OperandIsNotWriteable, ProgramExit
 )
-from core.machine.config import NULL_TERM
+from core.machine.config import (
+    NULL_TERM, OP_ADD, OP_SUB, OP_MUL, OP_DIV, OP_MOD, OP_XOR, OP_AND, OP_OR
+)
 from core.machine.memory_controller import MemoryController
 from core.model import (
     Address, Register, Label, Operand, Instruction,
-    Destination, Source, IndirectAddress
+    Destination, Source, IndirectAddress, OperandKind
 )
 from core.machine.register_controller import RegisterController
 
 
+# operand kinds fetched through the memory bus
+_MEMORY_BUS = frozenset({OperandKind.ADDRESS, OperandKind.INDIRECT_ADDRESS})
+
+# N and Z flags bits in ALU flags byte
+_NZ_MASK = (1 << Flag.N.value) | (1 << Flag.Z.value)
+
+# Conditional jump truth tables indexed by (N | Z << 1):
+# bit i is set if jump is taken in state i
+_JE = 0b1100
+_JNE = 0b0011
+_JL = 0b1010
+_JG = 0b0101
+_JLE = 0b1110
+_JGE = 0b1101
+
+# char codes used to print numbers
+_DIGIT_ORDS = [ord('0') + digit for digit in range(10)]
+_MINUS_ORD = ord('-')
+
+
+def executor(*names: str) -> Callable[[Callable], Callable]:
+    """
+    Mark function as executor of instruction with given name
+    (several names make aliases)
+    """
+    def decorator(func: Callable) -> Callable:
+        func.__instructions__ = names
+        return func
+    return decorator
+
+
+def _collect_instructions(namespace: dict) -> dict[str, Callable]:
+    """
+    Get {instruction_name: instruction_executor_function}
+    from functions in class namespace marked with @executor
+    """
+    return {
+        name: func
+        for func in namespace.values()
+        for name in getattr(func, '__instructions__', ())
+    }
+
+
 class InstructionController:
     """
     Instruction Controller class
         - current       -- the current executing instruction
         - current_sub   -- the current executing sub instruction
+        - fast          -- execute operations without intermediate steps,
+                           applied when instructions are bound
+
+    Instruction executor functions (i_*) return a generator
+    if instruction is executed step by step (tick by tick)
+    and None if it is executed at once.
+    In fast mode executors specialized for the bound instruction
+    are used where possible (_*_fast, _*_register, _reduce_reg_reg)
     """
 
+    # {instruction_name: ALU operation code}
     __reduce_ops__ = {
-        'add', 'sub', 'mul', 'div',
-        'mod', 'xor', 'and', 'or',
+        'add': OP_ADD, 'sub': OP_SUB, 'mul': OP_MUL, 'div': OP_DIV,
+        'mod': OP_MOD, 'xor': OP_XOR, 'and': OP_AND, 'or': OP_OR,
     }
 
     def __init__(
@@ -35,16 +92,52 @@ class InstructionController:
             clock: ClockGenerator,
             alu: ALU,
             memory: MemoryController,
-            registers: RegisterController
+            registers: RegisterController,
+            fast: bool = False
     ) -> None:
         self.current: Optional[Instruction] = None
         self.current_sub: Optional[Instruction] = None
+        self.fast = fast
 
         self.clock = clock
         self.alu = alu
         self.memory = memory
         self.registers = registers
 
+        # operand fetch/store handlers by exact operand type
+        self._getters: dict[type, Callable[[Operand], int]] = {
+            IndirectAddress: self._get_indirect,
+            Address: self.memory.get,
+            Register: self.registers.get,
+        }
+        self._setters: dict[type, Callable[[Operand, int], None]] = {
+            IndirectAddress: self._set_indirect,
+            Address: self.memory.set,
+            Register: self.registers.set,
+        }
+
+    def _indirect_address(self, operand: IndirectAddress) -> Address:
+        """
+        Shift indirect address by its offset and get direct address
+        """
+        offset: int = self.get_operand_value(operand.offset)
+        return Address(
+            label=operand.label,
+            value=(operand.value + offset)
+        )
+
+    def _get_indirect(self, operand: IndirectAddress) -> int:
+        """
+        Get value by indirect address
+        """
+        return self.memory.get(self._indirect_address(operand))
+
+    def _set_indirect(self, operand: IndirectAddress, value: int) -> None:
+        """
+        Set value by indirect address
+        """
+        self.memory.set(self._indirect_address(operand), value)
+
     def get_operand_value(self, operand: Operand) -> int:
         """
         Get operand value.
@@ -54,19 +147,10 @@ class InstructionController:
             - Label: get index
             - Constant: just get value
         """
-        if isinstance(operand, IndirectAddress):
-            offset: int = self.get_operand_value(operand.offset)
-            return self.memory.get(
-                Address(
-                    label=operand.label,
-                    value=(operand.value + offset)
-                )
-            )
-        if isinstance(operand, Address):
-            return self.memory.get(operand)
-        if isinstance(operand, Register):
-            return self.registers.get(operand)
-        return operand.value
+        getter: Optional[Callable] = self._getters.get(type(operand))
+        if getter is None:
+            return operand.value
+        return getter(operand)
 
     def set_operand_value(self, operand: Operand, value: int) -> None:
         """
@@ -76,74 +160,108 @@ class InstructionController:
             - Register: set value with RegisterController
             - Other: throw OperandIsNotWriteable
         """
-        if isinstance(operand, IndirectAddress):
-            offset: int = self.get_operand_value(operand.offset)
-            self.memory.set(
-                Address(
-                    label=operand.label,
-                    value=(operand.value + offset)
-                ), value
-            )
-        elif isinstance(operand, Address):
-            self.memory.set(operand, value)
-        elif isinstance(operand, Register):
-            self.registers.set(operand, value)
-        else:
+        setter: Optional[Callable] = self._setters.get(type(operand))
+        if setter is None:
             raise OperandIsNotWriteable(operand.value)
+        setter(operand, value)
+
+    def _operand_fetcher(self, operand: Operand) -> Callable[[], int]:
+        """
+        Get function that fetches operand value
+        """
+        getter: Optional[Callable] = self._getters.get(type(operand))
+        if getter is None:
+            value: int = operand.value
+            return lambda: value
+        return partial(getter, operand)
+
+    def _operand_setter(self, operand: Operand) -> Callable[[int], None]:
+        """
+        Get function that stores value into operand.
+        For not writeable operand it throws OperandIsNotWriteable
+        """
+        setter: Optional[Callable] = self._setters.get(type(operand))
+        if setter is None:
+            return partial(self.set_operand_value, operand)
+        return partial(setter, operand)
 
-    def _same_bus(self, op1: Operand, op2: Operand) -> bool:
+    @staticmethod
+    def _same_bus(kind1: int, kind2: int) -> bool:
         """
-        Check if operands fetching require the same bus:
+        Check if fetching of operands of given kinds requires the same bus:
             - memory bus
             - register bus
         """
         return (
-                isinstance(op1, (Address, IndirectAddress)) and
-                isinstance(op2, (Address, IndirectAddress))
+                kind1 in _MEMORY_BUS and kind2 in _MEMORY_BUS
         ) or (
-                isinstance(op1, Register) and isinstance(op2, Register)
+                kind1 == kind2 == OperandKind.REGISTER
         )
 
-    def _jump_to(self, label: Label) -> None:
-        """
-        Set instruction pointer to label value
-        """
-        self.registers.set_instruction_pointer(label.value - 1)
-
     def _reduce_op(
             self,
-            reducer: Callable,
+            op_id: int,
             dest: Destination,
             *operands: Source
     ) -> Iterator:
         """
-        Defines operation behavior applying reducer function to operands
+        Defines operation behavior applying ALU operation (op_id) to operands
             - Two operands.
-                Apply reducer to them and save result into "dest"
+                Apply operation to them and save result into "dest"
             - Three and more operands.
-                Apply reducer to "*operands" and save result into "dest"
+                Apply operation to "*operands" and save result into "dest"
+
+        Operation is executed step by step (tick by tick)
         """
-        operand: Source = operands[0]
         op1: int = self.get_operand_value(dest)
         # if operands require the same bus
-        if self._same_bus(dest, operand):
+        if (self.current_sub or self.current).same_bus:
             self.clock.tick()
             yield
-        op2: int = self.get_operand_value(operand)
+        op2: int = self.get_operand_value(operands[0])
         self.clock.tick()
         yield
-        result = self.alu.operation(reducer, op1, op2)
+        result = self.alu.operation_by_id(op_id, op1, op2)
         self.clock.tick()
         yield
         self.set_operand_value(dest, result)
 
-    def _jmp_if(self, label: Label, condition: bool) -> None:
+    def _reduce_reg_reg(self, op_id: int, instruction: Instruction) -> None:
         """
-        Jump to label if condition is True
+        Execute operation on two registers of instruction at once:
+        read register states, compute with flags and write back
         """
-        if condition:
-            self._jump_to(label)
+        states: dict[str, int] = self.registers.__states__
+        dest: str = instruction.operands[0].name
+        # registers require the same bus
+        self.clock.tick_n(2)
+        result: int = self.alu.operation_by_id(
+            op_id, states[dest], states[instruction.operands[1].name]
+        )
+        self.clock.tick()
+        states[dest] = _strip_number(result)
 
+    def _reduce_op_fast(
+            self,
+            op_id: int,
+            instruction: Instruction
+    ) -> None:
+        """
+        Execute operation of instruction without intermediate steps.
+        Clock is ticked in the same order as in step mode,
+        so failed operation takes the same number of ticks
+        """
+        op1: int = instruction.fetchers[0]()
+        # if operands require the same bus
+        if instruction.same_bus:
+            self.clock.tick()
+        op2: int = instruction.fetchers[1]()
+        self.clock.tick()
+        result: int = self.alu.operation_by_id(op_id, op1, op2)
+        self.clock.tick()
+        instruction.setter(result)
+
+    @executor('add')
     def i_add(self, dest: Destination, *ops: Source) -> Iterator:
         """
         ADD dest, *ops
@@ -154,8 +272,9 @@ class InstructionController:
             - ADD A, B, C, D
                 A = ((B + C) + D)
         """
-        yield from self._reduce_op(operator.add, dest, *ops)
+        return self._reduce_op(OP_ADD, dest, *ops)
 
+    @executor('sub')
     def i_sub(self, dest: Destination, *ops: Source) -> Iterator:
         """
         SUB dest, *ops
@@ -166,8 +285,9 @@ class InstructionController:
             - SUB A, B, C, D
                 A = ((B - C) - D)
         """
-        yield from self._reduce_op(operator.sub, dest, *ops)
+        return self._reduce_op(OP_SUB, dest, *ops)
 
+    @executor('mul')
     def i_mul(self, dest: Destination, *ops: Source) -> Iterator:
         """
         MUL dest, *ops
@@ -178,8 +298,9 @@ class InstructionController:
             - MUL A, B, C, D
                 A = ((B * C) * D)
         """
-        yield from self._reduce_op(operator.mul, dest, *ops)
+        return self._reduce_op(OP_MUL, dest, *ops)
 
+    @executor('div')
     def i_div(self, dest: Destination, *ops: Source) -> Iterator:
         """
         DIV dest, *ops
@@ -192,8 +313,9 @@ class InstructionController:
 
         Can raise ALUDZeroDivisionError
         """
-        yield from self._reduce_op(operator.floordiv, dest, *ops)
+        return self._reduce_op(OP_DIV, dest, *ops)
 
+    @executor('mod')
     def i_mod(self, dest: Destination, *ops: Source) -> Iterator:
         """
         MOD dest, *ops
@@ -206,8 +328,9 @@ class InstructionController:
 
         Can raise ALUDZeroDivisionError
         """
-        yield from self._reduce_op(operator.mod, dest, *ops)
+        return self._reduce_op(OP_MOD, dest, *ops)
 
+    @executor('xor')
     def i_xor(self, dest: Destination, *ops: Source) -> Iterator:
         """
         XOR dest, *ops
@@ -218,8 +341,9 @@ class InstructionController:
             - XOR A, B, C, D
                 A = ((B ^ C) ^ D)
         """
-        yield from self._reduce_op(operator.xor, dest, *ops)
+        return self._reduce_op(OP_XOR, dest, *ops)
 
+    @executor('and')
     def i_and(self, dest: Destination, *ops: Source) -> Iterator:
         """
         AND dest, *ops
@@ -230,8 +354,9 @@ class InstructionController:
             - AND A, B, C, D
                 A = ((B & C) & D)
         """
-        yield from self._reduce_op(operator.and_, dest, *ops)
+        return self._reduce_op(OP_AND, dest, *ops)
 
+    @executor('or')
     def i_or(self, dest: Destination, *ops: Source) -> Iterator:
         """
         OR dest, *ops
@@ -242,8 +367,9 @@ class InstructionController:
             - OR A, B, C, D
                 A = ((B | C) | D)
         """
-        yield from self._reduce_op(operator.or_, dest, *ops)
+        return self._reduce_op(OP_OR, dest, *ops)
 
+    @executor('dec')
     def i_dec(self, dest: Destination) -> Iterator:
         """
         DEC dest
@@ -255,6 +381,7 @@ class InstructionController:
         yield
         self.set_operand_value(dest, value - 1)
 
+    @executor('inc')
     def i_inc(self, dest: Destination) -> Iterator:
         """
         INC dest
@@ -266,88 +393,96 @@ class InstructionController:
         yield
         self.set_operand_value(dest, value + 1)
 
+    def _dec_register(self, instruction: Instruction) -> None:
+        """
+        DEC for readable and writable register in fast mode:
+        changes register state directly
+        """
+        states: dict[str, int] = self.registers.__states__
+        dest: str = instruction.operands[0].name
+        self.clock.tick()
+        states[dest] = _strip_number(states[dest] - 1)
+
+    def _inc_register(self, instruction: Instruction) -> None:
+        """
+        INC for readable and writable register in fast mode:
+        changes register state directly
+        """
+        states: dict[str, int] = self.registers.__states__
+        dest: str = instruction.operands[0].name
+        self.clock.tick()
+        states[dest] = _strip_number(states[dest] + 1)
+
+    @executor('jmp')
     def i_jmp(self, label: Label) -> None:
         """
         JMP label
 
         Jump to label without condition
         """
-        self._jump_to(label)
+        self.registers.set_instruction_pointer(label.target)
 
+    @executor('je')
     def i_je(self, label: Label) -> None:
         """
         JE label
 
         Jump to label if Z Flag is set (operands are equal)
         """
-        self._jmp_if(
-            label,
-            self.alu.get_flag(Flag.Z)
-        )
+        if _JE >> (self.alu.flags_byte & _NZ_MASK) & 1:
+            self.registers.set_instruction_pointer(label.target)
 
+    @executor('jne')
     def i_jne(self, label: Label) -> None:
         """
         JE label
 
         Jump to label if Z Flag is not set (operands are not equal)
         """
-        self._jmp_if(
-            label,
-            not self.alu.get_flag(Flag.Z)
-        )
+        if _JNE >> (self.alu.flags_byte & _NZ_MASK) & 1:
+            self.registers.set_instruction_pointer(label.target)
 
+    @executor('jl')
     def i_jl(self, label: Label) -> None:
         """
         JL label
 
         Jump to label if N Flag is set (first < second)
         """
-        self._jmp_if(
-            label,
-            self.alu.get_flag(Flag.N)
-        )
+        if _JL >> (self.alu.flags_byte & _NZ_MASK) & 1:
+            self.registers.set_instruction_pointer(label.target)
 
+    @executor('jg')
     def i_jg(self, label: Label) -> None:
         """
         JL label
 
         Jump to label if N Flag is not set (first > second)
         """
-        self._jmp_if(
-            label,
-            not self.alu.get_flag(Flag.N)
-        )
+        if _JG >> (self.alu.flags_byte & _NZ_MASK) & 1:
+            self.registers.set_instruction_pointer(label.target)
 
+    @executor('jle')
     def i_jle(self, label: Label) -> None:
         """
         JLE label
 
         Jump to label if Z or N flag is set (first <= second)
         """
-        self._jmp_if(
-            label,
-            (
-                    self.alu.get_flag(Flag.Z)
-                    or
-                    self.alu.get_flag(Flag.N)
-            )
-        )
+        if _JLE >> (self.alu.flags_byte & _NZ_MASK) & 1:
+            self.registers.set_instruction_pointer(label.target)
 
+    @executor('jge')
     def i_jge(self, label: Label) -> None:
         """
         JGE label
 
         Jump to label if Z or not N flag is set (first >= second)
         """
-        self._jmp_if(
-            label,
-            (
-                    self.alu.get_flag(Flag.Z)
-                    or
-                    not self.alu.get_flag(Flag.N)
-            )
-        )
+        if _JGE >> (self.alu.flags_byte & _NZ_MASK) & 1:
+            self.registers.set_instruction_pointer(label.target)
 
+    @executor('mov')
     def i_mov(self, dest: Destination, src: Source) -> Iterator:
         """
         MOV dest, src
@@ -362,6 +497,16 @@ class InstructionController:
         yield
         self.set_operand_value(dest, value)
 
+    def _mov_fast(self, instruction: Instruction) -> None:
+        """
+        Execute MOV of instruction at once
+        using its bound fetcher and setter
+        """
+        value: int = instruction.fetchers[1]()
+        self.clock.tick()
+        instruction.setter(value)
+
+    @executor('movn')
     def i_movn(self, dest: Address, src: Source) -> Iterator:
         """
         MOVN dest, src
@@ -371,24 +516,38 @@ class InstructionController:
         value: int = self.get_operand_value(src)
         self.clock.tick()
         yield
-        for digit in str(value):
-            self.set_operand_value(dest, ord(digit))
+        # char codes in reversed order
+        chars: list[int] = []
+        number: int = abs(value)
+        while True:
+            number, digit = divmod(number, 10)
+            chars.append(_DIGIT_ORDS[digit])
+            if not number:
+                break
+        if value < 0:
+            chars.append(_MINUS_ORD)
+        for char in reversed(chars):
+            self.set_operand_value(dest, char)
             self.clock.tick()
             yield
 
+    @executor('ldn')
     def i_ldn(self, dest: Address, src: Source) -> Iterator:
         """
         LDN dest, src
 
         Get number value from #STDIN and write into dest
         """
-        result: str = ''
+        # chars are joined once: int() accepts any unicode digits
+        # and whitespace, so codes aren't limited to a byte
+        chars: list[str] = []
         while (digit := self.get_operand_value(src)) != NULL_TERM:
-            result += chr(digit)
+            chars.append(chr(digit))
             self.clock.tick()
             yield
-        self.set_operand_value(dest, int(result))
+        self.set_operand_value(dest, int(''.join(chars)))
 
+    @executor('cmp')
     def i_cmp(self, var: Source, src: Source) -> Iterator:
         """
         CMP op1, op2
@@ -397,14 +556,28 @@ class InstructionController:
         """
         op1: int = self.get_operand_value(var)
         # if operands require the same bus
-        if self._same_bus(var, src):
+        if (self.current_sub or self.current).same_bus:
             self.clock.tick()
             yield
         op2: int = self.get_operand_value(src)
         self.clock.tick()
         yield
-        self.alu.operation(operator.sub, op1, op2)
+        self.alu.operation_by_id(OP_SUB, op1, op2)
 
+    def _cmp_fast(self, instruction: Instruction) -> None:
+        """
+        Execute CMP of instruction at once using its bound fetchers.
+        Clock is ticked in the same order as in step mode
+        """
+        op1: int = instruction.fetchers[0]()
+        # if operands require the same bus
+        if instruction.same_bus:
+            self.clock.tick()
+        op2: int = instruction.fetchers[1]()
+        self.clock.tick()
+        self.alu.operation_by_id(OP_SUB, op1, op2)
+
+    @executor('hlt')
     def i_hlt(self) -> Iterator:
         """
         HLT
@@ -415,29 +588,145 @@ class InstructionController:
         yield
         raise ProgramExit
 
-    def __execute(self, instruction: Instruction) -> Iterator | None:
-        result = self.get_all()[instruction.name](
-            self, *instruction.operands
+    # {instruction_name: instruction_executor_function}
+    # built once when the class body is executed
+    _DISPATCH: dict[str, Callable] = _collect_instructions(vars())
+
+    # fast mode executor functions specialized for register destination
+    _REGISTER_DISPATCH: dict[str, Callable] = {
+        'dec': _dec_register,
+        'inc': _inc_register,
+    }
+
+    # fast mode executor functions using bound fetchers and setter
+    _FAST_DISPATCH: dict[str, Callable] = {
+        'mov': _mov_fast,
+        'cmp': _cmp_fast,
+    }
+
+    def _is_rw_register(self, instruction: Instruction, index: int) -> bool:
+        """
+        Check if instruction operand is a register
+        that can be read and written
+        """
+        return (
+                instruction.operands[index].kind == OperandKind.REGISTER
+                and self.registers.is_readable(
+                    instruction.operands[index].name
+                )
+                and self.registers.is_writable(
+                    instruction.operands[index].name
+                )
         )
-        if isinstance(result, Iterable):
-            yield from result
 
-    def execute(self, instruction: Instruction) -> Iterator:
+    def _handler(
+            self,
+            instruction: Instruction
+    ) -> Callable[[], Iterator | None]:
+        """
+        Get executor of instruction with its arguments bound.
+        In fast mode specialized executor is used:
+            - ALU operation on two registers is fused
+            - other ALU operation uses bound fetchers and setter
+            - INC/DEC of readable and writable register
+              changes its state directly
+            - MOV and CMP use bound fetchers and setter
+        """
+        name: str = instruction.name
+        if self.fast:
+            if name in self.__reduce_ops__:
+                reduce: Callable[[int, Instruction], None] = (
+                    self._reduce_reg_reg if instruction.reg_reg
+                    else self._reduce_op_fast
+                )
+                return partial(reduce, self.__reduce_ops__[name], instruction)
+            if (
+                    name in self._REGISTER_DISPATCH
+                    and self._is_rw_register(instruction, 0)
+            ):
+                return partial(
+                    self._REGISTER_DISPATCH[name], self, instruction
+                )
+            if name in self._FAST_DISPATCH:
+                return partial(self._FAST_DISPATCH[name], self, instruction)
+        return partial(self._DISPATCH[name], self, *instruction.operands)
+
+    def bind_instructions(self, instructions: list[Instruction]) -> None:
+        """
+        Bind to every instruction (and sub instruction):
+            - executor function with its arguments, so it isn't looked up
+              by name and fast or step by step version isn't chosen
+              on every execution
+            - operand fetchers and destination setter,
+              so operand type isn't checked on every execution
+            - whether operands share the bus
+            - whether operation can be fused (register-register)
+            - jump targets of labels
+        """
+        for instruction in instructions:
+            for operand in instruction.operands:
+                if operand.kind == OperandKind.LABEL:
+                    operand.target = operand.value - 1
+            kinds: list[int] = [
+                operand.kind for operand in instruction.operands
+            ]
+            instruction.same_bus = (
+                len(kinds) >= 2 and self._same_bus(kinds[0], kinds[1])
+            )
+            instruction.reg_reg = (
+                instruction.name in self.__reduce_ops__
+                and len(kinds) == 2
+                and self._is_rw_register(instruction, 0)
+                and self._is_rw_register(instruction, 1)
+            )
+            instruction.handler = self._handler(instruction)
+            instruction.bound_to = self
+            instruction.fetchers = [
+                self._operand_fetcher(operand)
+                for operand in instruction.operands
+            ]
+            if instruction.operands:
+                instruction.setter = self._operand_setter(
+                    instruction.operands[0]
+                )
+            self.bind_instructions(instruction.sub)
+
+    def __execute(self, instruction: Instruction) -> Iterator | None:
         """
-        Execute instruction by its name
+        Call executor function of instruction.
+        Returns generator for step by step instructions,
+        None for instructions executed at once
+        """
+        if instruction.bound_to is not self:
+            self.bind_instructions([instruction])
+        return instruction.handler()
+
+    def __results(
+            self,
+            instruction: Instruction
+    ) -> Iterator[Iterator | None]:
+        """
+        Call executor functions of instruction (or of its sub instructions
+        one by one) and generate their results.
+        Step by step result must be run till the end before
+        the next one is requested
         """
         self.current = instruction
         self.current_sub = None
 
-        if self.current.sub:
-            for sub_instruction in self.current.sub:
+        if instruction.sub:
+            for sub_instruction in instruction.sub:
                 self.current_sub = sub_instruction
-                result = self.__execute(sub_instruction)
-                if isinstance(result, Iterable):
-                    yield from result
+                yield self.__execute(sub_instruction)
         else:
-            result = self.__execute(instruction)
-            if isinstance(result, Iterable):
+            yield self.__execute(instruction)
+
+    def execute(self, instruction: Instruction) -> Iterator:
+        """
+        Execute instruction by its name
+        """
+        for result in self.__results(instruction):
+            if result is not None:
                 yield from result
 
         # increment instruction pointer (next instruction)
@@ -449,17 +738,57 @@ class InstructionController:
         self.clock.inst()
         yield
 
+    def run_until(
+            self,
+            lines: list[Instruction],
+            max_instructions: int
+    ) -> int:
+        """
+        Execute up to max_instructions instructions from lines
+        without intermediate steps.
+        Ticks and instructions counted after execution are added
+        to the clock once for the whole batch
+        :return number of executed instructions
+        """
+        states: dict[str, int] = self.registers.__states__
+        lines_count: int = len(lines)
+        executed: int = 0
+        try:
+            while (
+                    executed < max_instructions
+                    and (pointer := states['RIP']) < lines_count
+            ):
+                for result in self.__results(lines[pointer]):
+                    if result is not None:
+                        deque(result, maxlen=0)
+                # increment instruction pointer (next instruction)
+                states['RIP'] += 1
+                executed += 1
+        finally:
+            self.clock.advance(executed, executed)
+        return executed
+
     @classmethod
     def get_all(cls) -> dict[str, Callable]:
         """
         Get dict with available instruction
         :return {instruction_name: instruction_executor_function}
         """
-        return {
-            key.replace('i_', ''): func
-            for key, func in cls.__dict__.items()
-            if key.startswith('i_')
-        }
+        return cls._DISPATCH
+
+
+def _annotation_name(annotation: object) -> str:
+    """
+    Readable name of type annotation:
+    class name or names of union members joined by ' | '
+    """
+    if annotation is NoneType:
+        return 'None'
+    if isinstance(annotation, type):
+        return annotation.__name__
+    if isinstance(annotation, UnionType) or get_origin(annotation) is Union:
+        return ' | '.join(map(_annotation_name, get_args(annotation)))
+    return str(annotation)
 
 
 def generate_instruction_docs() -> None:
@@ -480,11 +809,9 @@ def generate_instruction_docs() -> None:
             '```\n'
         )
         for key, value in function.__annotations__.items():
-            if isinstance(value, type):
-                value = value.__name__
-            elif isinstance(value, UnionType):
-                value = ' | '.join(x.__name__ for x in value.__args__)
-            doc_instructions.append(f'- **{key}**: `{value}`\n')
+            doc_instructions.append(
+                f'- **{key}**: `{_annotation_name(value)}`\n'
+            )
 
     with open('../../resources/instructions.md', 'w', encoding='utf8') as file:
         file.writelines(doc_instructions)
@@ -1,7 +1,20 @@
 # pylint: disable=missing-function-docstring
 # pylint: disable=missing-module-docstring
-from dataclasses import dataclass, field
-from typing import TypeAlias
+# pylint: disable=too-many-instance-attributes
+from dataclasses import MISSING, dataclass, field, fields
+from enum import IntEnum
+from typing import Callable, ClassVar, Optional, TypeAlias
+
+
+class OperandKind(IntEnum):
+    """
+    Operand kind tag (fits into one byte)
+    """
+    CONSTANT = 0
+    REGISTER = 1
+    ADDRESS = 2
+    INDIRECT_ADDRESS = 3
+    LABEL = 4
 
 
 class Operand:
@@ -14,6 +27,7 @@ class Operand:
         - Register
     """
     value: int
+    kind: ClassVar[OperandKind]
 
     def __str__(self) -> str:
         return str(self.value)
@@ -24,6 +38,8 @@ class Constant(Operand):
     """
     Read-only integer value
     """
+    kind: ClassVar[OperandKind] = OperandKind.CONSTANT
+
     value: int
 
 
@@ -46,6 +62,8 @@ class Register(Operand):
 
     Available registers declared in core.machine.registers
     """
+    kind: ClassVar[OperandKind] = OperandKind.REGISTER
+
     name: str
 
     def __str__(self) -> str:
@@ -59,6 +77,8 @@ class Address(Operand):
         - value -- real address in data memory
         - label -- link to data memory address
     """
+    kind: ClassVar[OperandKind] = OperandKind.ADDRESS
+
     value: int = -1
     label: str = ''
 
@@ -73,6 +93,8 @@ class IndirectAddress(Operand):
         - label     -- link to base data memory address
         - offset    -- offset operand that is being computed in runtime
     """
+    kind: ClassVar[OperandKind] = OperandKind.INDIRECT_ADDRESS
+
     offset: Operand
     label: str = ''
 
@@ -92,11 +114,17 @@ class LOC:
 class Label(LOC, Operand):
     """
     Label model
-        - name  --  link name to code section
-        - value --  real address in code section
+        - name      --  link name to code section
+        - value     --  real address in code section
+        - target    --  instruction pointer value to jump to
+                        (value - 1, as pointer is incremented after jump),
+                        bound when program is loaded
     """
+    kind: ClassVar[OperandKind] = OperandKind.LABEL
+
     name: str
     value: int = -1
+    target: int = field(default=-1, repr=False, compare=False)
 
     def __str__(self) -> str:
         return self.name
@@ -108,10 +136,43 @@ class Instruction(LOC):
     Instruction model
         - name      -- name of instruction
         - operands  -- list of operands this instruction uses
+        - handler   -- executor with its arguments, bound when program is loaded
+        - fetchers  -- operand value getters, bound when program is loaded
+        - setter    -- first operand value setter, bound when program is loaded
+        - same_bus  -- two first operands are fetched through the same bus,
+                       bound when program is loaded
+        - reg_reg   -- operation on two registers can be fused,
+                       bound when program is loaded
+        - bound_to  -- instruction controller the fields above are bound to
+    Bound fields (not compared) aren't stored in object file
     """
     name: str
     operands: list[Operand] = field(default_factory=list)
     sub: list['Instruction'] = field(default_factory=list)
+    handler: Optional[Callable[[], object]] = field(
+        default=None, repr=False, compare=False
+    )
+    fetchers: list[Callable[[], int]] = field(
+        default_factory=list, repr=False, compare=False
+    )
+    setter: Optional[Callable[[int], None]] = field(
+        default=None, repr=False, compare=False
+    )
+    same_bus: bool = field(default=False, repr=False, compare=False)
+    reg_reg: bool = field(default=False, repr=False, compare=False)
+    bound_to: Optional[object] = field(
+        default=None, repr=False, compare=False
+    )
+
+    def __getstate__(self) -> dict:
+        state: dict = self.__dict__.copy()
+        for bound in fields(self):
+            if not bound.compare:
+                state[bound.name] = (
+                    bound.default_factory() if bound.default is MISSING
+                    else bound.default
+                )
+        return state
 
     def __str__(self) -> str:
         op_str: str = ', '.join(map(str, self.operands))
@@ -2,14 +2,30 @@
 # pylint: disable=missing-module-docstring
 import io
 import os
+import pickle
 import tempfile
+from collections import deque
+from typing import Optional
 from unittest.mock import patch
 import pytest
 import main
+from core.file_helper import read_source_code
+from core.machine import Computer, Trace
+from core.translator import minify_text, parse_code
 
 
-@pytest.mark.golden_test("golden/*.yml")
-def test(golden):
+def run_golden(golden, trace: Trace) -> tuple[Computer, str, Optional[int]]:
+    """
+    Run golden source with main.run,
+    return computer, output and exit code (None if program exited normally)
+    """
+    computers: list[Computer] = []
+    exit_code: Optional[int] = None
+
+    def create_computer() -> Computer:
+        computers.append(Computer())
+        return computers[-1]
+
     with tempfile.TemporaryDirectory() as tmpdirname:
         source = os.path.join(tmpdirname, "source.asm")
         binary = os.path.join(tmpdirname, "source.o")
@@ -18,7 +34,52 @@ def test(golden):
             src.write(golden["source"])
 
         with patch('core.machine.io_controller.sys.stdin', io.StringIO(golden["input"])), \
-                patch('core.machine.io_controller.sys.stdout', new_callable=io.StringIO) as output:
-            main.run(source, binary)
+                patch('core.machine.io_controller.sys.stdout', new_callable=io.StringIO) as output, \
+                patch('main.Computer', side_effect=create_computer):
+            try:
+                main.run(source, binary, trace)
+            except SystemExit as exit_:
+                exit_code = exit_.code
+
+    return computers[0], output.getvalue(), exit_code
+
+
+@pytest.mark.parametrize('trace', [Trace.NO, Trace.INST])
+@pytest.mark.golden_test("golden/*.yml")
+def test(golden, trace):
+    computer, output, exit_code = run_golden(golden, trace)
+
+    assert exit_code is None
+    assert output == golden.out['output']
+    assert str(computer.clock) == golden.out['clock']
+    assert computer.r_controller.__states__ == golden.out['registers']
+
+
+@pytest.mark.parametrize('trace', [Trace.NO, Trace.INST])
+@pytest.mark.golden_test("golden/errors/*.yml")
+def test_error(golden, trace):
+    computer, output, exit_code = run_golden(golden, trace)
+
+    assert exit_code == 1
+    assert output == golden.out['output']
+    assert str(computer.clock) == golden.out['clock']
+    assert computer.r_controller.__states__ == golden.out['registers']
+
+
+def test_executed_program_is_picklable():
+    program = parse_code(minify_text(read_source_code('test/examples/hello.pyasm')))
+    with patch('core.machine.io_controller.sys.stdout', new_callable=io.StringIO):
+        deque(Computer().execute_program(program, Trace.NO), maxlen=0)
+
+    assert pickle.loads(pickle.dumps(program)) == program
+
+
+def test_instruction_is_rebound_by_other_controller():
+    program = parse_code(minify_text('section .text\n    MOV %rax, 1\n'))
+    first, second = Computer(), Computer()
+    second.instruction_executor.fast = True
+    first.instruction_executor.bind_instructions(program.text.lines)
+    deque(second.instruction_executor.execute(program.text.lines[0]), maxlen=0)
 
-        assert output.getvalue() == golden.out['output']
+    assert first.r_controller.__states__['RAX'] == 0
+    assert second.r_controller.__states__['RAX'] == 1